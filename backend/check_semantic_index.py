@@ -0,0 +1,116 @@
+"""
+Sanity checks for the article index: distinct stories about the same event
+must cluster together, unrelated stories must stay apart, and a stored story
+must come back as related coverage after a save/reload.
+
+Run from the backend directory: python check_semantic_index.py
+"""
+import tempfile
+from semantic_index import ArticleIndex
+
+# Every article shares the feed's common vocabulary (federal, grant, university,
+# research, innovation), so only story-specific terms can group them.
+ARTICLES = {
+    "chips_ohio": (
+        "Ohio State anchors new CHIPS Act tech hub",
+        "The Department of Commerce designated a Central Ohio consortium led by The Ohio State University "
+        "as a regional technology hub under the CHIPS and Science Act. The federal designation makes the "
+        "consortium eligible for implementation grants to expand semiconductor manufacturing, chip packaging "
+        "research and workforce training. University officials said the tech hub will connect research labs "
+        "with the Intel fab under construction in Licking County and grow the regional innovation ecosystem.",
+    ),
+    "chips_purdue": (
+        "Purdue-led Indiana consortium wins tech hub designation",
+        "Purdue University and Indiana partners were named a Tech Hub by the Economic Development "
+        "Administration, part of the CHIPS and Science Act program. The designation lets the coalition compete "
+        "for federal implementation grants focused on microelectronics, semiconductor packaging and defense "
+        "chips. Purdue said the hub will train engineers, expand clean-room research capacity and attract "
+        "chip manufacturers to the regional innovation ecosystem around West Lafayette.",
+    ),
+    "chips_arizona": (
+        "Arizona semiconductor tech hub receives EDA implementation grant",
+        "Arizona State University's semiconductor tech hub received a CHIPS Act implementation grant from the "
+        "Economic Development Administration. The federal funding supports chip manufacturing workforce "
+        "programs, advanced packaging research and supplier development near the TSMC fab in Phoenix, "
+        "strengthening the state's semiconductor innovation ecosystem.",
+    ),
+    "nih_training": (
+        "NIH expands training grants for biomedical PhD students",
+        "The National Institutes of Health announced new T32 institutional training grants for biomedical "
+        "doctoral programs. Universities can apply for federal funding to support graduate student stipends, "
+        "mentoring and rigorous research training in neuroscience, immunology and cancer biology.",
+    ),
+    "nsf_engines_1": (
+        "NSF Regional Innovation Engine awarded to North Carolina",
+        "The National Science Foundation selected a North Carolina coalition for an NSF Engines award of up "
+        "to $160 million over ten years. Led by university partners, the Regional Innovation Engine will focus "
+        "on sustainable agriculture technology, connecting federal research funding with farmers, startups "
+        "and workforce programs across the Piedmont innovation ecosystem.",
+    ),
+    "nsf_engines_2": (
+        "Second NSF Engines round funds Great Lakes water innovation",
+        "A Great Lakes coalition won an NSF Engines award from the National Science Foundation, a Regional "
+        "Innovation Engine for freshwater technology. The ten-year federal investment supports university "
+        "research on water treatment, agriculture runoff sensors and startups, with workforce programs that "
+        "build the regional innovation ecosystem.",
+    ),
+    "doe_efrc": (
+        "DOE renews Energy Frontier Research Centers",
+        "The Department of Energy Office of Science renewed funding for Energy Frontier Research Centers at "
+        "universities and national laboratories. The federal grants support basic research in catalysis, "
+        "battery chemistry and quantum materials for clean energy.",
+    ),
+    "ai_policy": (
+        "White House AI executive order directs agencies on university compute",
+        "A new executive order on artificial intelligence directs federal agencies to expand the National AI "
+        "Research Resource pilot, giving university researchers access to compute and datasets. The policy "
+        "also sets safety testing guidance for frontier AI models and funds AI research institutes.",
+    ),
+}
+RELATED_GROUPS = [{"chips_ohio", "chips_purdue", "chips_arizona"}, {"nsf_engines_1", "nsf_engines_2"}]
+
+
+def _as_article(name: str) -> dict:
+    title, content = ARTICLES[name]
+    return {"title": title, "link": f"https://example.gov/{name}", "source": "example.gov", "full_content": content}
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        index = ArticleIndex(tmp)
+        names = list(ARTICLES)
+        vectors = index.embed_articles([_as_article(name) for name in names])
+
+        similarity = (vectors @ vectors.T).toarray()
+        group_of = {name: i for i, group in enumerate(RELATED_GROUPS) for name in group}
+        related_scores, unrelated_scores = [], []
+        for a in range(len(names)):
+            for b in range(a + 1, len(names)):
+                same = names[a] in group_of and group_of.get(names[a]) == group_of.get(names[b])
+                (related_scores if same else unrelated_scores).append(similarity[a, b])
+        print(f"Related pairs:   min {min(related_scores):.2f}, max {max(related_scores):.2f}")
+        print(f"Unrelated pairs: min {min(unrelated_scores):.2f}, max {max(unrelated_scores):.2f}")
+
+        clusters = [{names[i] for i in rows} for rows in index.cluster(vectors)]
+        for group in RELATED_GROUPS:
+            assert group in clusters, clusters
+        assert sum(len(c) == 1 for c in clusters) == len(names) - sum(len(g) for g in RELATED_GROUPS), clusters
+        print(f"✅ Clustered {len(names)} articles into {len(clusters)} groups: {clusters}")
+
+        index.save()
+        reloaded = ArticleIndex(tmp)
+        follow_up = {
+            "title": "Commerce announces next round of CHIPS tech hub funding",
+            "link": "https://example.gov/chips_follow_up",
+            "source": "example.gov",
+            "full_content": (
+                "The Commerce Department opened a new round of CHIPS and Science Act implementation grants for "
+                "designated tech hubs, prioritizing semiconductor packaging, chip manufacturing workforce "
+                "training and university research partnerships."
+            ),
+        }
+        reloaded.embed_articles([follow_up])
+        related = reloaded.find_related_to_articles([follow_up], exclude={follow_up['content_hash']})
+        related_links = {past["link"] for _, past in related}
+        assert related_links == {f"https://example.gov/{name}" for name in RELATED_GROUPS[0]}, related
+        print(f"✅ Follow-up story linked to earlier CHIPS coverage: {[round(sim, 2) for sim, _ in related]}")
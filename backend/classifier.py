@@ -6,8 +6,15 @@ class ContentClassifier:
         self.api_token = os.getenv("HF_TOKEN")
         self.api_url = "https://api-inference.huggingface.co/models/facebook/bart-large-mnli"
         self.headers = {"Authorization": f"Bearer {self.api_token}"}
+        # Reused across calls so the TLS connection stays open between articles
+        self.http_client = httpx.Client(headers=self.headers, timeout=20.0)
         print("✅ Classifier configured to use Hugging Face Inference API.")
 
+    def warm_up(self):
+        """Opens a pooled connection to the inference API ahead of the first request."""
+        if self.api_token:
+            self.http_client.head(self.api_url)
+
     def evaluate_relevance(self, text: str, prompt: str) -> float:
         if not self.api_token or not text or not prompt:
             return 0.0
@@ -18,7 +25,7 @@ class ContentClassifier:
         }
         
         try:
-            response = httpx.post(self.api_url, headers=self.headers, json=payload, timeout=20.0)
+            response = self.http_client.post(self.api_url, json=payload)
             response.raise_for_status()
             result = response.json()
             score = result['scores'][0]
@@ -53,7 +53,7 @@ class TechArticleSearch:
             print(f"❌ API search for query '{query}' failed: {e}")
             return []
 
-    async def run_fed_landscape_search(self, selected_keywords: List[str], date_filter: str = "w") -> list:
+    async def run_fed_landscape_search(self, selected_keywords: List[str], date_filter: str = "w", max_articles: int = 25) -> list:
         if not selected_keywords:
             return []
 
@@ -75,7 +75,7 @@ class TechArticleSearch:
                 if article.get('link') and article['link'] not in combined_articles:
                     combined_articles[article['link']] = article
         
-        unique_articles = list(combined_articles.values())[:7]
+        unique_articles = list(combined_articles.values())[:max_articles]
         print(f"Found {len(unique_articles)} unique articles to scrape.")
         
         if not unique_articles:
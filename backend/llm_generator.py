@@ -17,6 +17,11 @@ class ReportGenerator:
             self.client = OpenAI(api_key=api_key)
             print("✅ Report Generator configured to use OpenAI GPT-4o.")
 
+    def warm_up(self):
+        """Opens the OpenAI connection pool with a cheap authenticated request."""
+        if self.client:
+            self.client.with_options(max_retries=0, timeout=10.0).models.list()
+
     # --- NEW: Main public method to get both summaries ---
     def generate_full_summary(self, article_content: str) -> dict:
         """
@@ -42,6 +47,25 @@ class ReportGenerator:
             "points": point_summary
         }
 
+    def generate_cluster_summary(self, articles: list, max_chars_per_article: int = 6000) -> dict:
+        """
+        Generates one full summary for a cluster of related articles, so a group
+        of stories costs the same number of LLM calls as a single article.
+
+        Returns:
+            A dictionary with 'paragraph' and 'points' as keys.
+        """
+        if len(articles) == 1:
+            return self.generate_full_summary(articles[0].get('full_content', ''))
+
+        combined_content = "\n\n---\n\n".join(
+            f"Article {i}: {article.get('title', 'No Title')}\n{(article.get('full_content') or '')[:max_chars_per_article]}"
+            for i, article in enumerate(articles, start=1)
+        )
+        return self.generate_full_summary(
+            "The following related articles cover the same story. Summarize them together.\n\n" + combined_content
+        )
+
     # --- NEW: Internal method for the 1-2 sentence paragraph summary ---
     def _generate_paragraph_summary(self, article_content: str) -> str:
         """
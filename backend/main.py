@@ -1,75 +1,186 @@
+from providers import LazyProvider, StartupProfiler, warm_up_in_background
+
+profiler = StartupProfiler()
+
+import os
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from data_collection import TechArticleSearch
-from classifier import ContentClassifier
-from llm_generator import ReportGenerator
 from datetime import datetime
 from typing import List
 import tools
 
+profiler.mark("imports_complete")
+
+# --- Providers ---
+# Heavy modules (openai, bs4, numpy/scikit-learn) are imported inside these factories,
+# so a cold start only pays for FastAPI itself before it can answer requests.
+def _build_report_generator():
+    from llm_generator import ReportGenerator
+    return ReportGenerator()
+
+def _build_searcher():
+    from data_collection import TechArticleSearch
+    return TechArticleSearch()
+
+def _build_classifier():
+    from classifier import ContentClassifier
+    return ContentClassifier()
+
+def _build_article_index():
+    from semantic_index import ArticleIndex
+    return ArticleIndex()
+
+report_generator_provider = LazyProvider("report_generator", _build_report_generator)
+searcher_provider = LazyProvider("searcher", _build_searcher)
+classifier_provider = LazyProvider("classifier", _build_classifier)
+article_index_provider = LazyProvider("article_index", _build_article_index)
+arcade_client_provider = LazyProvider("arcade_client", tools.get_client)
+PROVIDERS = [report_generator_provider, searcher_provider, classifier_provider, article_index_provider, arcade_client_provider]
+
+def _warmup_delay_seconds(default: float = 5.0) -> float:
+    """Seconds to wait after boot before warming the CPU-heavy providers (openai, numpy/scikit-learn)."""
+    value = os.getenv("WARMUP_DELAY_SECONDS", str(default))
+    try:
+        delay = float(value)
+    except ValueError:
+        delay = -1.0
+    if not 0 <= delay < float("inf"):
+        print(f"⚠️ Invalid WARMUP_DELAY_SECONDS={value!r}, using {default}.")
+        return default
+    return delay
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    profiler.mark("server_started")
+    warm_up_in_background(
+        profiler,
+        steps={
+            "classifier": classifier_provider.get,
+            "classifier_pool": lambda: classifier_provider.get().warm_up(),
+            "searcher": searcher_provider.get,
+        },
+        deferred_steps={
+            "arcade_client": arcade_client_provider.get,
+            "report_generator": report_generator_provider.get,
+            "openai_pool": lambda: report_generator_provider.get().warm_up(),
+            "article_index": article_index_provider.get,
+        },
+        delay_seconds=_warmup_delay_seconds(),
+    )
+    yield
+
 # --- App Setup ---
-app = FastAPI()
-report_generator = ReportGenerator()
-searcher = TechArticleSearch()
-classifier = ContentClassifier()
+app = FastAPI(lifespan=lifespan)
 
 # Final, robust CORS configuration to prevent connection errors
 origins = ["*"] 
 app.add_middleware(CORSMiddleware, allow_origins=origins, allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
+# Articles scraped per report; related ones are clustered into at most REPORT_SECTIONS sections
+CANDIDATE_ARTICLES = 25
+REPORT_SECTIONS = 7
+
 class ProcessRequest(BaseModel):
     recipient_email: str
     selected_keywords: List[str] = []
     date_filter: str = "w"
 
+# Blocking part of the report pipeline, run on a worker thread by generate_and_email_report
+def build_and_send_report(articles: list, keywords: List[str], email: str, classifier):
+    # Built here rather than before the search so a report that finds nothing
+    # never pulls in openai, numpy or scikit-learn ahead of the deferred warm-up.
+    report_generator = report_generator_provider.get()
+    article_index = article_index_provider.get()
+
+    print(f"🔬 Classifying {len(articles)} articles for relevance...")
+    relevance_context = (
+        "A relevant article discusses federal activities like new grants, programs, or policy "
+        f"affecting universities and innovation ecosystems related to {', '.join(keywords)}."
+    )
+    for article in articles:
+        article['relevance_score'] = classifier.evaluate_relevance(
+            article.get('full_content', ''), relevance_context
+        )
+
+    print("🧩 Clustering related articles...")
+    vectors = article_index.embed_articles(articles)
+    clusters = [
+        sorted(rows, key=lambda i: articles[i].get('relevance_score', 0), reverse=True)
+        for rows in article_index.cluster(vectors)
+    ]
+    clusters.sort(key=lambda rows: articles[rows[0]].get('relevance_score', 0), reverse=True)
+    current_hashes = {article['content_hash'] for article in articles}
+    print(f"Grouped {len(articles)} articles into {len(clusters)} clusters.")
+
+    print("🤖 Generating final intelligence report...")
+    report_title = "TUFF Fed Landscape Report"
+    report_content = f"# {report_title}\n\nThis report summarizes recent federal activities.\n\n---\n\n"
+
+    for rows in clusters[:REPORT_SECTIONS]:
+        cluster_articles = [articles[i] for i in rows]
+        lead = cluster_articles[0]
+        full_summary = report_generator.generate_cluster_summary(cluster_articles)
+        paragraph = full_summary.get('paragraph', 'Summary not available.')
+        points = full_summary.get('points', 'Key points not available.')
+
+        report_content += f"## {lead.get('title', 'No Title')}\n"
+        report_content += f"**Source:** {lead.get('source', 'N/A')}\n"
+        report_content += f"**Relevance:** {int(lead.get('relevance_score', 0) * 100)}%\n\n"
+        report_content += f"{paragraph}\n\n**Key Points:**\n{points}\n\n"
+        report_content += "**Articles in this story:**\n"
+        for article in cluster_articles:
+            report_content += f"- [{article.get('title', 'No Title')}]({article.get('link', '#')}) ({article.get('source', 'N/A')})\n"
+
+        related = article_index.find_related_to_articles(cluster_articles, exclude=current_hashes)
+        if related:
+            report_content += "\n**Related earlier coverage:**\n"
+            for _, past in related:
+                report_content += f"- [{past['title']}]({past['link']}) ({past['source']})\n"
+        report_content += "\n---\n\n"
+
+    article_index.save()
+
+    print("✉️ Creating Google Doc and sending email...")
+    subject = "Your TUFF Fed Landscape Report is Ready"
+    doc_url = tools.add_content_to_gdoc(report_content, f"{report_title} - {datetime.now().strftime('%Y-%m-%d')}")
+    tools.send_email(doc_url, subject, email)
+    print("✅ Background task completed successfully!")
+
 # This function contains all the heavy work and runs safely in the background
 async def generate_and_email_report(keywords: List[str], date_filter: str, email: str):
     try:
+        # Providers may still be warming up; wait for them off the event loop.
+        searcher, classifier = await asyncio.gather(
+            asyncio.to_thread(searcher_provider.get),
+            asyncio.to_thread(classifier_provider.get),
+        )
+
         print("🚀 Background task started: Searching for articles...")
-        articles = await searcher.run_fed_landscape_search(keywords, date_filter)
+        articles = await searcher.run_fed_landscape_search(keywords, date_filter, max_articles=CANDIDATE_ARTICLES)
         
         if not articles:
             print("⏹️ Background task finished: No articles found.")
-            tools.send_email("No new articles were found for your selected keywords.", "Your TUFF Fed Landscape Report", email)
-            return
-
-        print(f"🔬 Classifying {len(articles)} articles for relevance...")
-        relevance_context = (
-            "A relevant article discusses federal activities like new grants, programs, or policy "
-            f"affecting universities and innovation ecosystems related to {', '.join(keywords)}."
-        )
-        for article in articles:
-            article['relevance_score'] = classifier.evaluate_relevance(
-                article.get('full_content', ''), relevance_context
+            await asyncio.to_thread(
+                tools.send_email, "No new articles were found for your selected keywords.", "Your TUFF Fed Landscape Report", email
             )
+            return
 
-        sorted_articles = sorted(articles, key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        print("🤖 Generating final intelligence report...")
-        report_title = "TUFF Fed Landscape Report"
-        report_content = f"# {report_title}\n\nThis report summarizes recent federal activities.\n\n---\n\n"
-        
-        for article in sorted_articles[:7]:
-            full_summary = report_generator.generate_full_summary(article.get('full_content', ''))
-            paragraph = full_summary.get('paragraph', 'Summary not available.')
-            points = full_summary.get('points', 'Key points not available.')
-            
-            report_content += f"## {article.get('title', 'No Title')}\n"
-            report_content += f"**Source:** {article.get('source', 'N/A')}\n"
-            report_content += f"**Relevance:** {int(article.get('relevance_score', 0) * 100)}%\n\n"
-            report_content += f"{paragraph}\n\n**Key Points:**\n{points}\n\n"
-            report_content += f"[Read Full Article]({article.get('link', '#')})\n\n---\n\n"
-
-        print("✉️ Creating Google Doc and sending email...")
-        subject = "Your TUFF Fed Landscape Report is Ready"
-        doc_url = tools.add_content_to_gdoc(report_content, f"{report_title} - {datetime.now().strftime('%Y-%m-%d')}")
-        tools.send_email(doc_url, subject, email)
-        print("✅ Background task completed successfully!")
+        # Classification, summarization and the Arcade calls are blocking, so they run
+        # on a worker thread to keep the event loop free for incoming requests.
+        await asyncio.to_thread(build_and_send_report, articles, keywords, email, classifier)
 
     except Exception as e:
         print(f"❌ Error in background task: {e}")
-        tools.send_email(f"An error occurred during report generation: {e}", "Report Generation Failed", email)
+        await asyncio.to_thread(
+            tools.send_email, f"An error occurred during report generation: {e}", "Report Generation Failed", email
+        )
+
+@app.get("/api/startup-profile")
+async def startup_profile():
+    return profiler.report(PROVIDERS)
 
 # The API endpoint is now fast and reliable. It kicks off the background job.
 @app.post("/api/process")
@@ -0,0 +1,93 @@
+import time
+import threading
+
+class LazyProvider:
+    """
+    Builds a provider (and imports its heavy modules) on first use instead of at
+    import time. Safe to call from the warm-up thread and request handlers at once.
+    """
+    def __init__(self, name: str, factory):
+        self.name = name
+        self.factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+        self.init_seconds = None
+
+    @property
+    def ready(self) -> bool:
+        return self._instance is not None
+
+    def get(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start = time.perf_counter()
+                    self._instance = self.factory()
+                    self.init_seconds = time.perf_counter() - start
+                    print(f"⏱️ Initialized {self.name} in {self.init_seconds * 1000:.0f} ms.")
+        return self._instance
+
+
+class StartupProfiler:
+    """
+    Collects import, startup and warm-up timings for the /api/startup-profile report.
+
+    Milestones are measured from when main.py started importing, so interpreter
+    and uvicorn startup before that point are not included.
+    """
+    def __init__(self):
+        self.main_import_start = time.perf_counter()
+        self.timings = {}
+        self.warmup_errors = {}
+
+    def mark(self, name: str):
+        self.timings[name] = time.perf_counter() - self.main_import_start
+
+    def report(self, providers: list) -> dict:
+        return {
+            "milestones_ms_since_main_import": {name: round(seconds * 1000, 1) for name, seconds in self.timings.items()},
+            "note": (
+                "Milestones start when main.py begins importing and exclude interpreter and uvicorn startup. "
+                "imports_complete only covers the modules main.py imports itself; provider modules are "
+                "imported lazily and counted in each provider's init_ms."
+            ),
+            "providers": {
+                provider.name: {
+                    "ready": provider.ready,
+                    "init_ms": round(provider.init_seconds * 1000, 1) if provider.init_seconds is not None else None,
+                }
+                for provider in providers
+            },
+            # Only exception types are exposed here; full messages stay in the server log.
+            "warmup_errors": self.warmup_errors,
+        }
+
+
+def warm_up_in_background(profiler: StartupProfiler, steps: dict, deferred_steps: dict = None,
+                          delay_seconds: float = 0.0) -> threading.Thread:
+    """
+    Runs warm-up steps (provider initialization, opening connection pools) on a
+    daemon thread so the server can answer immediately. `deferred_steps` run only
+    after `delay_seconds`, keeping their CPU-heavy imports away from the request
+    that woke the service.
+    """
+    def _run_steps(stage: dict):
+        for name, step in stage.items():
+            try:
+                step()
+            except Exception as e:
+                profiler.warmup_errors[name] = type(e).__name__
+                print(f"❌ Warm-up step '{name}' failed: {e}")
+
+    def _run():
+        _run_steps(steps)
+        profiler.mark("warmup_eager_complete")
+        if deferred_steps:
+            time.sleep(delay_seconds)
+            _run_steps(deferred_steps)
+        profiler.mark("warmup_complete")
+        print(f"🔥 Warm-up finished: {profiler.timings}")
+
+    thread = threading.Thread(target=_run, name="provider-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,226 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+class ArticleIndex:
+    """
+    Local, CPU-only semantic index over every article we have reported on.
+
+    Articles are represented as TF-IDF vectors whose IDF weights come from the
+    whole stored history, so the vocabulary every article in this feed shares
+    ("federal", "grant", "university", ...) counts for little and the terms that
+    set a story apart dominate. Hashed term counts are cached on disk keyed by a
+    hash of the embedded text; the IDF weighting is recomputed as history grows.
+    Related-article lookups are an exact cosine search over the sparse vectors.
+
+    Report jobs run on worker threads and share one index, so every public method
+    that reads or changes the history holds `self._lock`.
+    """
+    HASH_FEATURES = 2 ** 18
+    MAX_EMBED_CHARS = 5000
+    # Cosine thresholds measured with check_semantic_index.py
+    CLUSTER_THRESHOLD = 0.12
+    RELATED_THRESHOLD = 0.12
+
+    def __init__(self, index_dir: str = None):
+        self.index_dir = index_dir or os.getenv("ARTICLE_INDEX_DIR", os.path.join(os.path.dirname(__file__), "data"))
+        self.counts_path = os.path.join(self.index_dir, "term_counts.npz")
+        self.articles_path = os.path.join(self.index_dir, "articles.json")
+        self.signature = f"tfidf-hash{self.HASH_FEATURES}"
+
+        self.vectorizer = HashingVectorizer(
+            n_features=self.HASH_FEATURES,
+            ngram_range=(1, 2),
+            stop_words="english",
+            alternate_sign=False,
+            norm=None,
+        )
+
+        self.keys = []
+        self.key_to_row = {}
+        self.counts = sparse.csr_matrix((0, self.HASH_FEATURES), dtype=np.float32)
+        self.doc_freq = np.zeros(self.HASH_FEATURES, dtype=np.int64)
+        self.articles = {}
+        self._weighted = None
+        self._lock = threading.RLock()
+        self._load()
+        print(f"✅ Article index loaded with {len(self.keys)} cached articles.")
+
+    # --- Persistence ---
+    def _load(self):
+        # Everything is loaded into locals first so a half-read index never leaves
+        # keys and term counts out of sync with the article history.
+        try:
+            data = np.load(self.counts_path, allow_pickle=False)
+            if str(data["signature"]) != self.signature:
+                print("⚠️ Embedding cache was built with different settings. Rebuilding.")
+                return
+            keys = [str(k) for k in data["keys"]]
+            counts = sparse.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]), shape=(len(keys), self.HASH_FEATURES)
+            )
+            with open(self.articles_path, "r", encoding="utf-8") as f:
+                articles = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"❌ Failed to load article index, starting empty: {e}")
+            return
+
+        self.keys = keys
+        self.counts = counts
+        self.doc_freq = np.bincount(counts.indices, minlength=self.HASH_FEATURES).astype(np.int64)
+        self.articles = articles
+        self.key_to_row = {key: row for row, key in enumerate(self.keys)}
+
+    def _write_atomically(self, path: str, write):
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, prefix=os.path.basename(path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def save(self):
+        """Writes the term-count cache and article history to disk atomically."""
+        with self._lock:
+            try:
+                os.makedirs(self.index_dir, exist_ok=True)
+                self._write_atomically(self.counts_path, lambda f: np.savez(
+                    f, signature=np.array(self.signature), keys=np.array(self.keys, dtype=str),
+                    data=self.counts.data, indices=self.counts.indices, indptr=self.counts.indptr,
+                ))
+                self._write_atomically(self.articles_path, lambda f: f.write(json.dumps(self.articles).encode("utf-8")))
+            except Exception as e:
+                print(f"❌ Failed to save article index: {e}")
+
+    # --- Embedding ---
+    def _embed_text(self, article: dict) -> str:
+        text = f"{article.get('title', '')}\n{article.get('full_content') or article.get('snippet', '')}"
+        return text[:self.MAX_EMBED_CHARS]
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _weight(self, counts: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Applies sublinear TF and smoothed IDF from the stored history, then L2-normalizes rows."""
+        idf = np.log((1 + len(self.keys)) / (1 + self.doc_freq)) + 1
+        weighted = counts.astype(np.float32)
+        weighted.data = 1 + np.log(weighted.data)
+        return normalize(weighted @ sparse.diags(idf.astype(np.float32)), norm="l2", copy=False).tocsr()
+
+    def _weighted_history(self) -> sparse.csr_matrix:
+        if self._weighted is None:
+            self._weighted = self._weight(self.counts)
+        return self._weighted
+
+    def embed_articles(self, articles: list) -> sparse.csr_matrix:
+        """
+        Adds the articles to the history and returns one unit-length TF-IDF row per
+        article. Term counts are only computed for content hashes not already cached.
+        """
+        with self._lock:
+            texts = [self._embed_text(article) for article in articles]
+            hashes = [self.content_hash(text) for text in texts]
+
+            missing = {}
+            for text, key in zip(texts, hashes):
+                if key not in self.key_to_row and key not in missing:
+                    missing[key] = text
+
+            if missing:
+                new_counts = self.vectorizer.transform(list(missing.values())).astype(np.float32).tocsr()
+                new_counts.sum_duplicates()
+                start = len(self.keys)
+                self.keys.extend(missing.keys())
+                self.counts = sparse.vstack([self.counts, new_counts], format="csr")
+                self.doc_freq += np.bincount(new_counts.indices, minlength=self.HASH_FEATURES)
+                self._weighted = None
+                for offset, key in enumerate(missing.keys()):
+                    self.key_to_row[key] = start + offset
+            print(f"🧮 Embedded {len(articles)} articles ({len(missing)} new, {len(articles) - len(missing)} cached).")
+
+            for article, key in zip(articles, hashes):
+                article['content_hash'] = key
+                self.articles[key] = {
+                    "title": article.get('title', 'No Title'),
+                    "link": article.get('link', '#'),
+                    "source": article.get('source', 'N/A'),
+                }
+            return self._weighted_history()[[self.key_to_row[key] for key in hashes]]
+
+    # --- Related-article lookup ---
+    def find_related(self, vector: sparse.csr_matrix, k: int = 3, min_similarity: float = RELATED_THRESHOLD,
+                     exclude: set = None) -> list:
+        """
+        Looks up stored articles similar to the unit-length row `vector` by exact
+        cosine similarity.
+
+        Returns:
+            A list of (similarity, article_metadata) tuples, most similar first.
+        """
+        with self._lock:
+            exclude = exclude or set()
+            if len(self.keys) == 0:
+                return []
+
+            similarities = (self._weighted_history() @ vector.T).toarray().ravel()
+            related = []
+            for row in np.argsort(-similarities):
+                if similarities[row] < min_similarity or len(related) >= k:
+                    break
+                key = self.keys[row]
+                if key in exclude or key not in self.articles:
+                    continue
+                related.append((float(similarities[row]), self.articles[key]))
+            return related
+
+    def find_related_to_articles(self, articles: list, k: int = 3, exclude: set = None) -> list:
+        """
+        Looks up stored articles similar to a group of already-embedded articles,
+        using the normalized centroid of their TF-IDF vectors.
+        """
+        with self._lock:
+            rows = [self.key_to_row[article['content_hash']] for article in articles]
+            centroid = sparse.csr_matrix(self._weighted_history()[rows].sum(axis=0))
+            if centroid.nnz == 0:
+                return []
+            return self.find_related(normalize(centroid), k=k, exclude=exclude)
+
+    # --- Clustering ---
+    @staticmethod
+    def cluster(vectors: sparse.csr_matrix, threshold: float = CLUSTER_THRESHOLD) -> list:
+        """
+        Groups vectors by average-linkage agglomerative clustering on cosine
+        similarity, merging until no pair of clusters is above `threshold`.
+
+        Returns:
+            A list of clusters, each a list of row indices into `vectors`.
+        """
+        clusters = [[i] for i in range(vectors.shape[0])]
+        if len(clusters) < 2:
+            return clusters
+        similarity = (vectors @ vectors.T).toarray()
+
+        while len(clusters) > 1:
+            best_pair, best_score = None, threshold
+            for a in range(len(clusters)):
+                for b in range(a + 1, len(clusters)):
+                    score = similarity[np.ix_(clusters[a], clusters[b])].mean()
+                    if score >= best_score:
+                        best_pair, best_score = (a, b), score
+            if best_pair is None:
+                break
+            a, b = best_pair
+            clusters[a].extend(clusters.pop(b))
+        return clusters
+
@@ -1,5 +1,5 @@
 import os
-from arcadepy import Arcade
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,10 +8,23 @@ load_dotenv()
 ARCADE_API_KEY = os.getenv("ARCADE_API_KEY")
 USER_ID = os.getenv("ARCADE_USER_ID")
 
-if not all([ARCADE_API_KEY, USER_ID]):
-    raise ValueError("ARCADE_API_KEY and ARCADE_USER_ID must be set in the .env file.")
+_client = None
+_client_lock = threading.Lock()
 
-client = Arcade(api_key=ARCADE_API_KEY)
+def get_client():
+    """
+    Creates the Arcade client on first use, so importing this module is cheap and
+    a missing key only fails the tool call instead of the whole server.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not all([ARCADE_API_KEY, USER_ID]):
+                    raise ValueError("ARCADE_API_KEY and ARCADE_USER_ID must be set in the .env file.")
+                from arcadepy import Arcade
+                _client = Arcade(api_key=ARCADE_API_KEY)
+    return _client
 
 # --- Tool Definitions ---
 
@@ -41,7 +54,7 @@ def add_content_to_gdoc(content: str, file_name: str = "AI Intelligence Report")
         return "Error: ARCADE_USER_ID is not set in the .env file."
     print(f"TOOL CALLED: Creating Google Doc titled '{file_name}'...")
     try:
-        result = client.tools.execute(
+        result = get_client().tools.execute(
             tool_name="GoogleDocs.CreateDocumentFromText@4.0.0",
             input={"title": file_name, "text_content": content},
             user_id=USER_ID,
@@ -65,7 +78,7 @@ def send_email(email_body: str, subject: str, recipient: str):
     """Sends an email with the provided content as the body."""
     print(f"📧 Calling Arcade to send email to {recipient}...")
     try:
-        result = client.tools.execute(
+        result = get_client().tools.execute(
             tool_name="Gmail.SendEmail@3.0.0",
             input={"body": email_body, "subject": subject, "recipient": recipient},
             user_id=USER_ID,